@@ -1,16 +1,55 @@
 #!/usr/bin/env python3
+import functools
 import json
 import os
-import uuid
+import secrets
+import sqlite3
+import time
 from datetime import datetime
+from operator import itemgetter
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-# File paths for JSON storage
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer orjson for (de)serialization when available; both return/accept bytes
+if orjson is not None:
+    def _dumps(data, pretty=False):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    _loads = orjson.loads
+else:
+    def _dumps(data, pretty=False):
+        if pretty:
+            return json.dumps(data, indent=2).encode()
+        return json.dumps(data, separators=(',', ':')).encode()
+    _loads = json.loads
+
+# File paths for storage
 DATA_DIR = "data"
+DB_FILE = os.path.join(DATA_DIR, "procurement.db")
+# Legacy JSON files, imported into the database once at startup
 PURCHASES_FILE = os.path.join(DATA_DIR, "purchases.json")
 VENDORS_FILE = os.path.join(DATA_DIR, "vendors.json")
+EXPORT_DIR = os.path.join(DATA_DIR, "export")
+
+PURCHASE_FIELDS = (
+    "id", "item_name", "quantity", "requester", "vendor_id", "notes", "status",
+    "approver", "approval_date", "approval_notes", "created_at", "updated_at",
+)
+VENDOR_FIELDS = (
+    "id", "name", "contact_email", "phone", "address", "price_rating",
+    "delivery_time", "avg_review", "review_count", "created_at", "updated_at",
+)
+READONLY_FIELDS = ("id", "created_at")
+# Maintained from the reviews table; never taken from caller-supplied updates
+DERIVED_VENDOR_FIELDS = ("avg_review", "review_count")
+IO_BUFFER_SIZE = 64 * 1024
+# Below this many vendors the per-vendor loop beats building NumPy arrays
+NUMPY_MIN_VENDORS = 1000
 
 # Initialize console for pretty output
 console = Console()
@@ -18,6 +57,51 @@ console = Console()
 # Ensure data directory exists
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Database connection and schema
+_new_database = not os.path.exists(DB_FILE)
+conn = sqlite3.connect(DB_FILE)
+conn.row_factory = sqlite3.Row
+conn.execute("PRAGMA journal_mode=WAL")
+conn.execute("PRAGMA synchronous=NORMAL")
+conn.execute("PRAGMA foreign_keys=ON")
+conn.executescript("""
+CREATE TABLE IF NOT EXISTS purchases (
+    id TEXT PRIMARY KEY,
+    item_name TEXT NOT NULL,
+    quantity INTEGER NOT NULL,
+    requester TEXT NOT NULL,
+    vendor_id TEXT,
+    notes TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'pending',
+    approver TEXT,
+    approval_date TEXT,
+    approval_notes TEXT NOT NULL DEFAULT '',
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vendors (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    contact_email TEXT,
+    phone TEXT,
+    address TEXT,
+    price_rating REAL NOT NULL,
+    delivery_time REAL NOT NULL,
+    avg_review REAL NOT NULL DEFAULT 0,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reviews (
+    vendor_id TEXT NOT NULL REFERENCES vendors(id) ON DELETE CASCADE,
+    rating REAL NOT NULL,
+    comment TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_vendor_id ON reviews(vendor_id);
+CREATE INDEX IF NOT EXISTS purchases_status ON purchases(status);
+""")
+
 # Helper functions for data operations
 def load_data(file_path, default=None):
     """Load data from JSON file or return default if file doesn't exist."""
@@ -27,18 +111,96 @@ def load_data(file_path, default=None):
     if not os.path.exists(file_path):
         return default
     
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        return _loads(f.read())
+
+def save_data(file_path, data, pretty=False):
+    """Atomically save data to JSON file (compact unless pretty is set)."""
+    # Serialize up front so the file sees one write instead of many small chunks
+    payload = _dumps(data, pretty)
+    tmp_path = file_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _insert_sql(table, fields):
+    columns = ", ".join(fields)
+    params = ", ".join(f":{field}" for field in fields)
+    return f"INSERT INTO {table} ({columns}) VALUES ({params})"
+
+def _update_sql(table, fields):
+    assignments = ", ".join(f"{field} = :{field}" for field in fields)
+    return f"UPDATE {table} SET {assignments} WHERE id = :id"
+
+def _insert_reviews(vendor_id, reviews):
+    conn.executemany(
+        "INSERT INTO reviews (vendor_id, rating, comment, date) VALUES (?, ?, ?, ?)",
+        [(vendor_id, r.get('rating', 0), r.get('comment', ""), r.get('date', "")) for r in reviews]
+    )
+
+def _to_ns(value):
+    """Convert a legacy ISO-8601 timestamp to integer nanoseconds since the epoch."""
+    if value is None:
+        return None
+    return round(datetime.fromisoformat(value).timestamp() * 1_000_000) * 1000
+
+def _iso(ns):
+    """Render integer nanoseconds since the epoch as an ISO-8601 string."""
+    return datetime.fromtimestamp(ns / 1_000_000_000).isoformat()
+
+def _review_stats(reviews):
+    """Return (avg_review, review_count) for a list of reviews."""
+    if not reviews:
+        return 0, 0
+    total = sum(review.get('rating', 0) for review in reviews)
+    return total / len(reviews), len(reviews)
+
+def _load_reviews(vendor_id):
+    rows = conn.execute(
+        "SELECT rating, comment, date FROM reviews WHERE vendor_id = ? ORDER BY rowid",
+        (vendor_id,)
+    )
+    return [dict(row) for row in rows]
 
-def save_data(file_path, data):
-    """Save data to JSON file."""
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+def migrate_json_data():
+    """Import legacy JSON files into the database, then set them aside."""
+    if os.path.exists(PURCHASES_FILE):
+        with conn:
+            for p in load_data(PURCHASES_FILE):
+                record = {field: p.get(field) for field in PURCHASE_FIELDS}
+                record['notes'] = record['notes'] or ""
+                record['approval_notes'] = record['approval_notes'] or ""
+                record['created_at'] = _to_ns(record['created_at'])
+                record['updated_at'] = _to_ns(record['updated_at'])
+                # Skip ids that are already imported; any other constraint error aborts the import
+                conn.execute(_insert_sql("purchases", PURCHASE_FIELDS) + " ON CONFLICT(id) DO NOTHING", record)
+        os.replace(PURCHASES_FILE, PURCHASES_FILE + ".migrated")
+    
+    if os.path.exists(VENDORS_FILE):
+        with conn:
+            for v in load_data(VENDORS_FILE):
+                record = {field: v.get(field) for field in VENDOR_FIELDS}
+                record['avg_review'], record['review_count'] = _review_stats(v.get('reviews', []))
+                record['created_at'] = _to_ns(record['created_at'])
+                record['updated_at'] = _to_ns(record['updated_at'])
+                cursor = conn.execute(_insert_sql("vendors", VENDOR_FIELDS) + " ON CONFLICT(id) DO NOTHING", record)
+                if cursor.rowcount:
+                    _insert_reviews(v['id'], v.get('reviews', []))
+        os.replace(VENDORS_FILE, VENDORS_FILE + ".migrated")
 
 # Entity Classes
 class Purchase:
+    __slots__ = PURCHASE_FIELDS
+    
     def __init__(self, item_name, quantity, requester, vendor_id=None, notes=""):
-        self.id = str(uuid.uuid4())
+        self.id = secrets.token_hex(16)
         self.item_name = item_name
         self.quantity = quantity
         self.requester = requester
@@ -48,22 +210,35 @@ class Purchase:
         self.approver = None
         self.approval_date = None
         self.approval_notes = ""
-        self.created_at = datetime.now().isoformat()
+        self.created_at = time.time_ns()
         self.updated_at = self.created_at
     
     def to_dict(self):
-        return self.__dict__
+        return {
+            'id': self.id,
+            'item_name': self.item_name,
+            'quantity': self.quantity,
+            'requester': self.requester,
+            'vendor_id': self.vendor_id,
+            'notes': self.notes,
+            'status': self.status,
+            'approver': self.approver,
+            'approval_date': self.approval_date,
+            'approval_notes': self.approval_notes,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+        }
     
     @classmethod
     def from_dict(cls, data):
-        purchase = cls(
-            item_name=data['item_name'],
-            quantity=data['quantity'],
-            requester=data['requester'],
-            vendor_id=data.get('vendor_id'),
-            notes=data.get('notes', "")
-        )
+        # Skip __init__: every field is about to be overwritten anyway
+        purchase = cls.__new__(cls)
         purchase.id = data['id']
+        purchase.item_name = data['item_name']
+        purchase.quantity = data['quantity']
+        purchase.requester = data['requester']
+        purchase.vendor_id = data.get('vendor_id')
+        purchase.notes = data.get('notes', "")
         purchase.status = data['status']
         purchase.approver = data.get('approver')
         purchase.approval_date = data.get('approval_date')
@@ -73,33 +248,62 @@ class Purchase:
         return purchase
 
 class Vendor:
+    __slots__ = VENDOR_FIELDS + ("_reviews",)
+    
     def __init__(self, name, contact_email, phone, address, price_rating, delivery_time, reviews=None):
-        self.id = str(uuid.uuid4())
+        self.id = secrets.token_hex(16)
         self.name = name
         self.contact_email = contact_email
         self.phone = phone
         self.address = address
         self.price_rating = price_rating  # 1-10 scale (lower is cheaper)
         self.delivery_time = delivery_time  # Average delivery time in days
-        self.reviews = reviews or []
-        self.created_at = datetime.now().isoformat()
+        self._reviews = reviews or []
+        # Kept alongside reviews so scoring doesn't need to re-sum them
+        self.avg_review, self.review_count = _review_stats(self._reviews)
+        self.created_at = time.time_ns()
         self.updated_at = self.created_at
     
     def to_dict(self):
-        return self.__dict__
+        return {
+            'id': self.id,
+            'name': self.name,
+            'contact_email': self.contact_email,
+            'phone': self.phone,
+            'address': self.address,
+            'price_rating': self.price_rating,
+            'delivery_time': self.delivery_time,
+            'reviews': self.reviews,
+            'avg_review': self.avg_review,
+            'review_count': self.review_count,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+        }
+    
+    @property
+    def reviews(self):
+        # Loaded on first access; scoring and listings only need avg_review/review_count
+        if self._reviews is None:
+            self._reviews = _load_reviews(self.id)
+        return self._reviews
     
     @classmethod
     def from_dict(cls, data):
-        vendor = cls(
-            name=data['name'],
-            contact_email=data['contact_email'],
-            phone=data['phone'],
-            address=data['address'],
-            price_rating=data['price_rating'],
-            delivery_time=data['delivery_time'],
-            reviews=data.get('reviews', [])
-        )
+        # Skip __init__: every field is about to be overwritten anyway
+        vendor = cls.__new__(cls)
         vendor.id = data['id']
+        vendor.name = data['name']
+        vendor.contact_email = data['contact_email']
+        vendor.phone = data['phone']
+        vendor.address = data['address']
+        vendor.price_rating = data['price_rating']
+        vendor.delivery_time = data['delivery_time']
+        vendor._reviews = data.get('reviews')
+        if 'avg_review' in data:
+            vendor.avg_review = data['avg_review']
+            vendor.review_count = data['review_count']
+        else:
+            vendor.avg_review, vendor.review_count = _review_stats(vendor.reviews)
         vendor.created_at = data['created_at']
         vendor.updated_at = data['updated_at']
         return vendor
@@ -107,143 +311,198 @@ class Vendor:
 # CRUD Operations for Purchase Requests
 def create_purchase(item_name, quantity, requester, vendor_id=None, notes=""):
     purchase = Purchase(item_name, quantity, requester, vendor_id, notes)
-    purchases = load_data(PURCHASES_FILE)
-    purchases.append(purchase.to_dict())
-    save_data(PURCHASES_FILE, purchases)
+    with conn:
+        conn.execute(_insert_sql("purchases", PURCHASE_FIELDS), purchase.to_dict())
     return purchase
 
 def get_purchase(purchase_id):
-    purchases = load_data(PURCHASES_FILE)
-    for p in purchases:
-        if p['id'] == purchase_id:
-            return Purchase.from_dict(p)
-    return None
+    row = conn.execute("SELECT * FROM purchases WHERE id = ?", (purchase_id,)).fetchone()
+    if row is None:
+        return None
+    return Purchase.from_dict(dict(row))
 
 def update_purchase(purchase_id, updates):
-    purchases = load_data(PURCHASES_FILE)
-    for i, p in enumerate(purchases):
-        if p['id'] == purchase_id:
-            for key, value in updates.items():
-                if key in p and key not in ['id', 'created_at']:
-                    p[key] = value
-            p['updated_at'] = datetime.now().isoformat()
-            save_data(PURCHASES_FILE, purchases)
-            return Purchase.from_dict(p)
-    return None
+    fields = {key: value for key, value in updates.items()
+              if key in PURCHASE_FIELDS and key not in READONLY_FIELDS}
+    fields['updated_at'] = time.time_ns()
+    with conn:
+        cursor = conn.execute(_update_sql("purchases", fields), {**fields, 'id': purchase_id})
+    if not cursor.rowcount:
+        return None
+    return get_purchase(purchase_id)
 
 def delete_purchase(purchase_id):
-    purchases = load_data(PURCHASES_FILE)
-    for i, p in enumerate(purchases):
-        if p['id'] == purchase_id:
-            del purchases[i]
-            save_data(PURCHASES_FILE, purchases)
-            return True
-    return False
+    with conn:
+        cursor = conn.execute("DELETE FROM purchases WHERE id = ?", (purchase_id,))
+    return cursor.rowcount > 0
 
 def list_purchases():
-    return [Purchase.from_dict(p) for p in load_data(PURCHASES_FILE)]
+    rows = conn.execute("SELECT * FROM purchases ORDER BY rowid")
+    return [Purchase.from_dict(dict(row)) for row in rows]
+
+def list_purchases_raw():
+    """Return purchases as plain dicts, for callers that only display them."""
+    rows = conn.execute("SELECT * FROM purchases ORDER BY rowid")
+    return [dict(row) for row in rows]
+
+def iter_purchases(status=None):
+    """Yield purchases as plain dicts, optionally only those with the given status."""
+    if status is None:
+        rows = conn.execute("SELECT * FROM purchases ORDER BY rowid")
+    else:
+        rows = conn.execute("SELECT * FROM purchases WHERE status = ? ORDER BY rowid", (status,))
+    for row in rows:
+        yield dict(row)
 
 # CRUD Operations for Vendors
 def create_vendor(name, contact_email, phone, address, price_rating, delivery_time, reviews=None):
     vendor = Vendor(name, contact_email, phone, address, price_rating, delivery_time, reviews)
-    vendors = load_data(VENDORS_FILE)
-    vendors.append(vendor.to_dict())
-    save_data(VENDORS_FILE, vendors)
+    with conn:
+        conn.execute(_insert_sql("vendors", VENDOR_FIELDS), vendor.to_dict())
+        _insert_reviews(vendor.id, vendor.reviews)
     return vendor
 
 def get_vendor(vendor_id):
-    vendors = load_data(VENDORS_FILE)
-    for v in vendors:
-        if v['id'] == vendor_id:
-            return Vendor.from_dict(v)
-    return None
+    row = conn.execute("SELECT * FROM vendors WHERE id = ?", (vendor_id,)).fetchone()
+    if row is None:
+        return None
+    return Vendor.from_dict(dict(row))
 
 def update_vendor(vendor_id, updates):
-    vendors = load_data(VENDORS_FILE)
-    for i, v in enumerate(vendors):
-        if v['id'] == vendor_id:
-            for key, value in updates.items():
-                if key in v and key not in ['id', 'created_at']:
-                    v[key] = value
-            v['updated_at'] = datetime.now().isoformat()
-            save_data(VENDORS_FILE, vendors)
-            return Vendor.from_dict(v)
-    return None
+    fields = {key: value for key, value in updates.items()
+              if key in VENDOR_FIELDS
+              and key not in READONLY_FIELDS and key not in DERIVED_VENDOR_FIELDS}
+    if 'reviews' in updates:
+        fields['avg_review'], fields['review_count'] = _review_stats(updates['reviews'])
+    fields['updated_at'] = time.time_ns()
+    with conn:
+        cursor = conn.execute(_update_sql("vendors", fields), {**fields, 'id': vendor_id})
+        if not cursor.rowcount:
+            return None
+        if 'reviews' in updates:
+            conn.execute("DELETE FROM reviews WHERE vendor_id = ?", (vendor_id,))
+            _insert_reviews(vendor_id, updates['reviews'])
+    return get_vendor(vendor_id)
+
+def add_review(vendor_id, rating, comment=""):
+    """Append a single review to a vendor."""
+    with conn:
+        # Fold the new rating into the stored running average
+        cursor = conn.execute(
+            "UPDATE vendors SET avg_review = (avg_review * review_count + ?) / (review_count + 1), "
+            "review_count = review_count + 1, updated_at = ? WHERE id = ?",
+            (rating, time.time_ns(), vendor_id)
+        )
+        if not cursor.rowcount:
+            return None
+        review = {"rating": rating, "comment": comment, "date": datetime.now().isoformat()}
+        _insert_reviews(vendor_id, [review])
+    return get_vendor(vendor_id)
 
 def delete_vendor(vendor_id):
-    vendors = load_data(VENDORS_FILE)
-    for i, v in enumerate(vendors):
-        if v['id'] == vendor_id:
-            del vendors[i]
-            save_data(VENDORS_FILE, vendors)
-            return True
-    return False
+    with conn:
+        cursor = conn.execute("DELETE FROM vendors WHERE id = ?", (vendor_id,))
+    return cursor.rowcount > 0
 
-def list_vendors():
-    return [Vendor.from_dict(v) for v in load_data(VENDORS_FILE)]
+def list_vendors(with_reviews=False):
+    """List all vendors; reviews are loaded lazily unless with_reviews is set."""
+    rows = conn.execute("SELECT * FROM vendors ORDER BY rowid").fetchall()
+    if not with_reviews:
+        return [Vendor.from_dict(dict(row)) for row in rows]
+    
+    reviews = {}
+    for row in conn.execute("SELECT * FROM reviews ORDER BY rowid"):
+        reviews.setdefault(row['vendor_id'], []).append(
+            {"rating": row['rating'], "comment": row['comment'], "date": row['date']}
+        )
+    return [Vendor.from_dict({**row, 'reviews': reviews.get(row['id'], [])}) for row in rows]
 
 # Special Functions
+def _decide_purchase(purchase_id, status, approver, notes):
+    """Move a pending purchase to status in a single conditional UPDATE.
+    
+    Returns (purchase, changed); purchase is None if the ID doesn't exist.
+    """
+    with conn:
+        cursor = conn.execute(
+            "UPDATE purchases SET status = ?, approver = ?, approval_date = ?, "
+            "approval_notes = ?, updated_at = ? WHERE id = ? AND status = 'pending'",
+            (status, approver, datetime.now().isoformat(), notes, time.time_ns(), purchase_id)
+        )
+    return get_purchase(purchase_id), cursor.rowcount > 0
+
 def approve_purchase(purchase_id, approver, notes=""):
     """Approve a purchase request."""
-    purchase = get_purchase(purchase_id)
+    purchase, changed = _decide_purchase(purchase_id, "approved", approver, notes)
     
     if not purchase:
         console.print(f"[bold red]Error:[/bold red] Purchase with ID {purchase_id} not found.")
         return None
     
-    if purchase.status != "pending":
+    if not changed:
         console.print(f"[bold yellow]Warning:[/bold yellow] Purchase is already {purchase.status}.")
         return purchase
     
-    # Update purchase to approved status
-    updates = {
-        "status": "approved",
-        "approver": approver,
-        "approval_date": datetime.now().isoformat(),
-        "approval_notes": notes
-    }
-    
-    purchase = update_purchase(purchase_id, updates)
     console.print(f"[bold green]Success:[/bold green] Purchase has been approved by {approver}!")
     
     return purchase
 
 def reject_purchase(purchase_id, approver, notes=""):
     """Reject a purchase request."""
-    purchase = get_purchase(purchase_id)
+    purchase, changed = _decide_purchase(purchase_id, "rejected", approver, notes)
     
     if not purchase:
         console.print(f"[bold red]Error:[/bold red] Purchase with ID {purchase_id} not found.")
         return None
     
-    if purchase.status != "pending":
+    if not changed:
         console.print(f"[bold yellow]Warning:[/bold yellow] Purchase is already {purchase.status}.")
         return purchase
     
-    # Update purchase to rejected status
-    updates = {
-        "status": "rejected",
-        "approver": approver,
-        "approval_date": datetime.now().isoformat(),
-        "approval_notes": notes
-    }
-    
-    purchase = update_purchase(purchase_id, updates)
     console.print(f"[bold red]Note:[/bold red] Purchase has been rejected by {approver}.")
     
     return purchase
 
-def compare_vendors(vendor_ids):
-    """Evaluate vendors based on price, delivery time, and reviews."""
-    vendors = []
+@functools.lru_cache(maxsize=1024)
+def _score(price_rating, delivery_time, avg_review):
+    """Overall score for the given inputs; memoized since it depends on nothing else."""
+    # Calculate an overall score (lower is better)
+    # 40% price, 40% delivery time, 20% reviews
+    price_factor = price_rating / 10 * 0.4
+    delivery_factor = min(delivery_time, 30) / 30 * 0.4
+    review_factor = (5 - avg_review) / 5 * 0.2 if avg_review > 0 else 0.1
     
-    for vid in vendor_ids:
-        vendor = get_vendor(vid)
-        if vendor:
-            vendors.append(vendor)
-        else:
-            console.print(f"[bold yellow]Warning:[/bold yellow] Vendor with ID {vid} not found.")
+    return 10 - ((price_factor + delivery_factor + review_factor) * 10)
+
+def compute_score(vendor):
+    """Return (overall_score, avg_review) for a vendor; higher scores are better."""
+    return _score(vendor.price_rating, vendor.delivery_time, vendor.avg_review), vendor.avg_review
+
+def _numpy():
+    """Import NumPy on first use; None if it isn't installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def score_vendors(vendors):
+    """Return [(overall_score, avg_review), ...] for vendors, in order."""
+    np = _numpy() if len(vendors) >= NUMPY_MIN_VENDORS else None
+    if np is None:
+        return [compute_score(vendor) for vendor in vendors]
     
+    # Same formula as compute_score, applied to whole columns at once
+    count = len(vendors)
+    price = np.fromiter((v.price_rating for v in vendors), float, count)
+    delivery = np.minimum(np.fromiter((v.delivery_time for v in vendors), float, count), 30)
+    avg = np.fromiter((v.avg_review for v in vendors), float, count)
+    review_factor = np.where(avg > 0, (5 - avg) / 5 * 0.2, 0.1)
+    scores = 10 - ((price / 10 * 0.4 + delivery / 30 * 0.4 + review_factor) * 10)
+    return list(zip(scores.tolist(), avg.tolist()))
+
+def compare_vendors(vendors):
+    """Evaluate vendors based on price, delivery time, and reviews."""
     if not vendors:
         console.print("[bold red]Error:[/bold red] No valid vendors to compare.")
         return
@@ -257,49 +516,51 @@ def compare_vendors(vendor_ids):
     table.add_column("Avg. Review", justify="center")
     table.add_column("Overall Score", justify="center")
     
-    for vendor in vendors:
-        # Calculate average review score
-        avg_review = 0
-        if vendor.reviews:
-            total = sum(review.get('rating', 0) for review in vendor.reviews)
-            avg_review = total / len(vendor.reviews)
-        
-        # Calculate an overall score (lower is better)
-        # 40% price, 40% delivery time, 20% reviews
-        price_factor = vendor.price_rating / 10 * 0.4
-        delivery_factor = min(vendor.delivery_time, 30) / 30 * 0.4
-        review_factor = (5 - avg_review) / 5 * 0.2 if avg_review > 0 else 0.1
-        
-        overall_score = 10 - ((price_factor + delivery_factor + review_factor) * 10)
-        overall_score = round(overall_score, 1)
-        
+    # Score each vendor once; the table and the recommendation share the result
+    scored = [(score, avg, vendor) for (score, avg), vendor in zip(score_vendors(vendors), vendors)]
+    
+    for overall_score, avg_review, vendor in scored:
         table.add_row(
             vendor.name,
             str(vendor.price_rating),
             str(vendor.delivery_time),
-            f"{avg_review:.1f}" if vendor.reviews else "No reviews",
-            f"{overall_score}"
+            f"{avg_review:.1f}" if vendor.review_count else "No reviews",
+            f"{round(overall_score, 1)}"
         )
     
     console.print(table)
     
     # Recommend the best vendor (highest overall score)
-    best_vendor = max(vendors, key=lambda v: 
-        10 - ((v.price_rating / 10 * 0.4) + 
-              (min(v.delivery_time, 30) / 30 * 0.4) + 
-              ((5 - (sum(r.get('rating', 0) for r in v.reviews) / len(v.reviews) if v.reviews else 0)) / 5 * 0.2 if v.reviews else 0.1))
-    )
+    best_vendor = max(scored, key=itemgetter(0))[2]
     
     console.print(Panel(f"[bold green]Recommended Vendor:[/bold green] {best_vendor.name}", 
                         title="Recommendation", border_style="green"))
 
+def _export_record(record):
+    """Copy of a record with its integer timestamps rendered as ISO-8601."""
+    return {**record, 'created_at': _iso(record['created_at']), 'updated_at': _iso(record['updated_at'])}
+
+def export_data(pretty=True):
+    """Write all purchases and vendors to JSON files in EXPORT_DIR."""
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    purchases_path = os.path.join(EXPORT_DIR, "purchases.json")
+    vendors_path = os.path.join(EXPORT_DIR, "vendors.json")
+    purchases = [_export_record(p) for p in list_purchases_raw()]
+    vendors = [_export_record(v.to_dict()) for v in list_vendors(with_reviews=True)]
+    save_data(purchases_path, purchases, pretty=pretty)
+    save_data(vendors_path, vendors, pretty=pretty)
+    return purchases_path, vendors_path
+
 # Main CLI interface
 def main():
     """Main function to run the procurement system."""
     console.print("[bold green]Internal Procurement System[/bold green]")
     
-    # Initialize with sample data if empty
-    if not os.path.exists(VENDORS_FILE):
+    # Initialize with sample data only for a new database with no vendors to import
+    seed_sample_data = _new_database and not os.path.exists(VENDORS_FILE)
+    migrate_json_data()
+    
+    if seed_sample_data:
         create_vendor("Acme Supplies", "contact@acme.com", "555-123-4567", 
                      "123 Main St, Anytown", 6.5, 3.5)
         create_vendor("MegaCorp", "sales@megacorp.com", "555-987-6543", 
@@ -312,6 +573,7 @@ def main():
         console.print("3. Manage Vendors")
         console.print("4. Approve/Reject Purchase")
         console.print("5. Compare Vendors")
+        console.print("6. Export Data")
         console.print("0. Exit")
         
         choice = console.input("[bold cyan]Select an option:[/bold cyan] ")
@@ -337,7 +599,7 @@ def main():
             console.print(f"[green]Purchase created with ID: {purchase.id}[/green]")
             
         elif choice == "2":
-            purchases = list_purchases()
+            purchases = list_purchases_raw()
             
             if not purchases:
                 console.print("[yellow]No purchase requests found.[/yellow]")
@@ -353,12 +615,12 @@ def main():
             
             for p in purchases:
                 table.add_row(
-                    p.id, 
-                    p.item_name, 
-                    str(p.quantity), 
-                    p.requester, 
-                    p.status,
-                    p.approver or "-"
+                    p['id'], 
+                    p['item_name'], 
+                    str(p['quantity']), 
+                    p['requester'], 
+                    p['status'],
+                    p['approver'] or "-"
                 )
             
             console.print(table)
@@ -408,7 +670,7 @@ def main():
                         v.name, 
                         str(v.price_rating), 
                         f"{v.delivery_time} days",
-                        str(len(v.reviews))
+                        str(v.review_count)
                     )
                 
                 console.print(table)
@@ -436,29 +698,25 @@ def main():
                         
                     comment = console.input("[bold]Comment:[/bold] ")
                     
-                    review = {"rating": rating, "comment": comment, "date": datetime.now().isoformat()}
-                    update_vendor(vendor.id, {"reviews": vendor.reviews + [review]})
+                    add_review(vendor.id, rating, comment)
                     console.print("[green]Review added![/green]")
                     
                 except (ValueError, IndexError):
                     console.print("[bold red]Error:[/bold red] Invalid input.")
                 
         elif choice == "4":
-            purchases = list_purchases()
-            pending = [p for p in purchases if p.status == "pending"]
-            
-            if not pending:
-                console.print("[yellow]No pending purchases found.[/yellow]")
-                continue
-                
             table = Table(title="Pending Purchases")
             table.add_column("ID")
             table.add_column("Item")
             table.add_column("Quantity")
             table.add_column("Requester")
             
-            for p in pending:
-                table.add_row(p.id, p.item_name, str(p.quantity), p.requester)
+            for p in iter_purchases(status="pending"):
+                table.add_row(p['id'], p['item_name'], str(p['quantity']), p['requester'])
+            
+            if not table.row_count:
+                console.print("[yellow]No pending purchases found.[/yellow]")
+                continue
             
             console.print(table)
             
@@ -499,17 +757,21 @@ def main():
             vendor_indices = console.input("[bold]Enter vendor numbers to compare (comma-separated):[/bold] ")
             try:
                 indices = [int(idx.strip()) - 1 for idx in vendor_indices.split(",")]
-                vendor_ids = [vendors[idx].id for idx in indices if 0 <= idx < len(vendors)]
+                vendors_subset = [vendors[idx] for idx in indices if 0 <= idx < len(vendors)]
                 
-                if len(vendor_ids) < 2:
+                if len(vendors_subset) < 2:
                     console.print("[bold red]Error:[/bold red] Please select at least 2 valid vendors.")
                     continue
                     
-                compare_vendors(vendor_ids)
+                compare_vendors(vendors_subset)
                 
             except (ValueError, IndexError):
                 console.print("[bold red]Error:[/bold red] Invalid input. Please enter valid vendor numbers.")
             
+        elif choice == "6":
+            purchases_path, vendors_path = export_data()
+            console.print(f"[green]Exported purchases to {purchases_path} and vendors to {vendors_path}[/green]")
+            
         elif choice == "0":
             console.print("[green]Thank you for using the procurement system. Goodbye![/green]")
             break
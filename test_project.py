@@ -0,0 +1,310 @@
+import importlib
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+import pytest
+
+
+def load_project():
+    """Import a fresh copy of project.py, as a new CLI start would."""
+    sys.modules.pop("project", None)
+    return importlib.import_module("project")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """project.py backed by a database under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    module = load_project()
+    yield module
+    sys.modules["project"].conn.close()
+    sys.modules.pop("project", None)
+
+
+def write_legacy(project, purchases, vendors):
+    with open(project.PURCHASES_FILE, "w") as f:
+        json.dump(purchases, f)
+    with open(project.VENDORS_FILE, "w") as f:
+        json.dump(vendors, f)
+
+
+def run_main(project, monkeypatch):
+    """Start the CLI and exit immediately from the main menu."""
+    monkeypatch.setattr(project.console, "input", lambda prompt="": "0")
+    project.main()
+
+
+LEGACY_VENDOR = {
+    "id": "v-1",
+    "name": "Acme Supplies",
+    "contact_email": "contact@acme.com",
+    "phone": "555-123-4567",
+    "address": "123 Main St, Anytown",
+    "price_rating": 6.5,
+    "delivery_time": 3.5,
+    "reviews": [
+        {"rating": 4, "comment": "Fast", "date": "2024-01-02T10:00:00"},
+        {"rating": 2, "comment": "Late once", "date": "2024-02-03T10:00:00"},
+    ],
+    "created_at": "2024-01-01T09:00:00",
+    "updated_at": "2024-02-03T10:00:00",
+}
+
+LEGACY_PURCHASE = {
+    "id": "p-1",
+    "item_name": "Printer paper",
+    "quantity": 10,
+    "requester": "Sam",
+    "vendor_id": "v-1",
+    "notes": "",
+    "status": "approved",
+    "approver": "Alex",
+    "approval_date": "2024-01-05T12:00:00",
+    "approval_notes": "ok",
+    "created_at": "2024-01-04T08:30:00",
+    "updated_at": "2024-01-05T12:00:00",
+}
+
+
+def test_purchase_crud_round_trip(project):
+    purchase = project.create_purchase("Stapler", 2, "Sam", notes="blue")
+
+    fetched = project.get_purchase(purchase.id)
+    assert fetched.to_dict() == purchase.to_dict()
+
+    updated = project.update_purchase(purchase.id, {"quantity": 5, "id": "other"})
+    assert updated.id == purchase.id
+    assert updated.quantity == 5
+    assert updated.updated_at >= purchase.updated_at
+
+    assert [p.id for p in project.list_purchases()] == [purchase.id]
+    assert project.delete_purchase(purchase.id)
+    assert project.get_purchase(purchase.id) is None
+    assert not project.delete_purchase(purchase.id)
+
+
+def test_vendor_crud_round_trip(project):
+    vendor = project.create_vendor("MegaCorp", "sales@megacorp.com", "555-987-6543",
+                                   "456 Business Ave", 4.2, 5.0)
+
+    project.add_review(vendor.id, 5, "Great")
+    project.add_review(vendor.id, 3, "Fine")
+    fetched = project.get_vendor(vendor.id)
+    assert [r['comment'] for r in fetched.reviews] == ["Great", "Fine"]
+
+    updated = project.update_vendor(vendor.id, {"name": "MegaCorp Ltd"})
+    assert updated.name == "MegaCorp Ltd"
+    assert len(updated.reviews) == 2
+
+    assert project.delete_vendor(vendor.id)
+    assert project.get_vendor(vendor.id) is None
+    assert project.conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0] == 0
+
+
+def test_migrate_json_imports_records_and_reviews(project):
+    write_legacy(project, [LEGACY_PURCHASE], [LEGACY_VENDOR])
+
+    project.migrate_json_data()
+
+    assert not os.path.exists(project.PURCHASES_FILE)
+    assert not os.path.exists(project.VENDORS_FILE)
+    assert os.path.exists(project.PURCHASES_FILE + ".migrated")
+    assert os.path.exists(project.VENDORS_FILE + ".migrated")
+
+    purchase = project.get_purchase("p-1")
+    assert purchase.status == "approved"
+    assert isinstance(purchase.created_at, int)
+    assert project._iso(purchase.created_at) == "2024-01-04T08:30:00"
+    assert purchase.approval_notes == "ok"
+
+    vendor = project.get_vendor("v-1")
+    assert vendor.name == "Acme Supplies"
+    assert (vendor.avg_review, vendor.review_count) == (3, 2)
+    assert vendor.reviews == [
+        {"rating": 4, "comment": "Fast", "date": "2024-01-02T10:00:00"},
+        {"rating": 2, "comment": "Late once", "date": "2024-02-03T10:00:00"},
+    ]
+
+
+def test_migrate_json_skips_duplicate_ids(project):
+    write_legacy(project, [LEGACY_PURCHASE], [LEGACY_VENDOR])
+    project.migrate_json_data()
+    write_legacy(project, [LEGACY_PURCHASE], [LEGACY_VENDOR])
+
+    project.migrate_json_data()
+
+    assert len(project.list_purchases()) == 1
+    assert len(project.list_vendors()) == 1
+    assert project.conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0] == 2
+
+
+def test_migrate_json_rejects_malformed_records(project):
+    malformed = {key: value for key, value in LEGACY_VENDOR.items() if key != "name"}
+    write_legacy(project, [], [malformed])
+
+    with pytest.raises(sqlite3.IntegrityError):
+        project.migrate_json_data()
+
+    assert os.path.exists(project.VENDORS_FILE)
+    assert project.list_vendors() == []
+
+
+def test_sample_vendors_seeded_only_for_new_database(project, monkeypatch):
+    run_main(project, monkeypatch)
+    vendors = project.list_vendors()
+    assert [v.name for v in vendors] == ["Acme Supplies", "MegaCorp"]
+
+    for vendor in vendors:
+        project.delete_vendor(vendor.id)
+    project.conn.close()
+
+    restarted = load_project()
+    run_main(restarted, monkeypatch)
+    assert restarted.list_vendors() == []
+
+
+def test_sample_vendors_not_seeded_over_legacy_data(project, monkeypatch):
+    write_legacy(project, [], [LEGACY_VENDOR])
+
+    run_main(project, monkeypatch)
+
+    assert [v.name for v in project.list_vendors()] == ["Acme Supplies"]
+
+
+def test_save_data_replaces_file_atomically(project, tmp_path):
+    path = str(tmp_path / "out.json")
+
+    project.save_data(path, [{"id": "a"}])
+    project.save_data(path, [{"id": "b"}])
+
+    assert project.load_data(path) == [{"id": "b"}]
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_save_data_failure_keeps_existing_file(project, tmp_path, monkeypatch):
+    path = str(tmp_path / "out.json")
+    project.save_data(path, [{"id": "a"}])
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(project.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        project.save_data(path, [{"id": "b"}])
+
+    assert project.load_data(path) == [{"id": "a"}]
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_save_data_is_compact_unless_pretty(project, tmp_path):
+    path = str(tmp_path / "out.json")
+    data = [{"id": "a", "tags": [1, 2]}]
+
+    project.save_data(path, data)
+    with open(path) as f:
+        compact = f.read()
+    project.save_data(path, data, pretty=True)
+    with open(path) as f:
+        pretty = f.read()
+
+    assert compact == '[{"id":"a","tags":[1,2]}]'
+    assert pretty == json.dumps(data, indent=2)
+
+
+def test_export_data_writes_pretty_json(project):
+    purchase = project.create_purchase("Stapler", 2, "Sam")
+    vendor = project.create_vendor("MegaCorp", "sales@megacorp.com", "555-987-6543",
+                                   "456 Business Ave", 4.2, 5.0)
+    project.add_review(vendor.id, 5, "Great")
+
+    purchases_path, vendors_path = project.export_data()
+
+    with open(purchases_path) as f:
+        text = f.read()
+    assert text.startswith("[\n  {")
+    assert [p['id'] for p in json.loads(text)] == [purchase.id]
+    with open(vendors_path) as f:
+        vendors = json.load(f)
+    assert [v['id'] for v in vendors] == [vendor.id]
+    assert [r['comment'] for r in vendors[0]['reviews']] == ["Great"]
+    assert vendors[0]['created_at'] == project._iso(vendor.created_at)
+    assert datetime.fromisoformat(vendors[0]['updated_at'])
+
+
+def test_purchase_decided_only_once(project):
+    purchase = project.create_purchase("Desk", 1, "Sam")
+    pending = project.create_purchase("Chair", 2, "Sam")
+
+    approved = project.approve_purchase(purchase.id, "Alex", "fine")
+    assert approved.status == "approved"
+    assert approved.approver == "Alex"
+    assert approved.approval_notes == "fine"
+
+    assert project.reject_purchase(purchase.id, "Jo").status == "approved"
+    assert project.approve_purchase("missing", "Alex") is None
+
+    assert [p['id'] for p in project.iter_purchases(status="pending")] == [pending.id]
+    assert [p['id'] for p in project.iter_purchases()] == [purchase.id, pending.id]
+
+
+def make_vendors(project, count):
+    return [
+        project.Vendor(f"Vendor {i}", "sales@example.com", "555-000-0000", "1 Road",
+                       i % 10, i % 40, [{"rating": r} for r in range(i % 6)])
+        for i in range(count)
+    ]
+
+
+def test_score_vendors_matches_compute_score(project):
+    vendors = make_vendors(project, 50)
+
+    assert project.score_vendors(vendors) == [project.compute_score(v) for v in vendors]
+
+
+def test_score_vendors_numpy_matches_compute_score(project, monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(project, "NUMPY_MIN_VENDORS", 0)
+    vendors = make_vendors(project, 50)
+
+    assert project.score_vendors(vendors) == [project.compute_score(v) for v in vendors]
+
+
+def test_add_review_keeps_running_average(project):
+    vendor = project.create_vendor("MegaCorp", "sales@megacorp.com", "555-987-6543",
+                                   "456 Business Ave", 4.2, 5.0)
+    assert (vendor.avg_review, vendor.review_count) == (0, 0)
+
+    project.add_review(vendor.id, 5)
+    project.add_review(vendor.id, 2)
+    updated = project.add_review(vendor.id, 2)
+
+    assert (updated.avg_review, updated.review_count) == (3, 3)
+    assert [v.review_count for v in project.list_vendors()] == [3]
+
+
+def test_update_vendor_ignores_supplied_review_stats(project):
+    vendor = project.create_vendor("MegaCorp", "sales@megacorp.com", "555-987-6543",
+                                   "456 Business Ave", 4.2, 5.0, [{"rating": 4}])
+
+    updated = project.update_vendor(vendor.id, {"avg_review": 5, "review_count": 10})
+    assert (updated.avg_review, updated.review_count) == (4, 1)
+
+    updated = project.update_vendor(vendor.id, {"reviews": [{"rating": 1}, {"rating": 2}]})
+    assert (updated.avg_review, updated.review_count) == (1.5, 2)
+    assert [r['rating'] for r in updated.reviews] == [1, 2]
+
+
+def test_score_is_memoized_on_its_inputs(project):
+    first, second = make_vendors(project, 2)
+    second.price_rating, second.delivery_time = first.price_rating, first.delivery_time
+    second.avg_review = first.avg_review
+    project._score.cache_clear()
+
+    assert project.compute_score(first) == project.compute_score(second)
+    assert project._score.cache_info().hits == 1
+
+    second.avg_review = 4.5
+    assert project.compute_score(second) != project.compute_score(first)